@@ -0,0 +1,305 @@
+"""Offline benchmarks for the hot paths in main.py.
+
+    python benchmarks/bench_main.py run -o before.json
+    python benchmarks/bench_main.py run -o after.json
+    python benchmarks/bench_main.py compare before.json after.json --threshold 0.1
+
+Every case runs against a fresh habits.db in a temporary directory, and the
+Telegram bot, update and context objects are stubbed, so nothing touches the network.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytz  # noqa: E402
+
+import main  # noqa: E402
+
+USER_ID = 1
+TABLE_SIZES = (100, 1_000, 10_000, 50_000)
+RENDER_SIZES = (10, 100, 1_000, 5_000)
+QUICK_TABLE_SIZES = (100, 1_000)
+QUICK_RENDER_SIZES = (10, 100)
+DISPATCH_TEXTS = ("Помощь", "Мои привычки", "Добавить привычку", "Что-то непонятное")
+
+
+class StubBot:
+    def __init__(self):
+        self.sent = 0
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent += 1
+
+
+class StubMessage:
+    def __init__(self, text):
+        self.text = text
+        self.chat_id = USER_ID
+        self.from_user = SimpleNamespace(id=USER_ID)
+
+    async def reply_text(self, text, **kwargs):
+        pass
+
+
+class StubJob:
+    def __init__(self, data):
+        self.data = data
+        self.chat_id = USER_ID
+
+    def schedule_removal(self):
+        pass
+
+
+@contextmanager
+def fresh_db():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            main.init_db()
+            yield
+        finally:
+            os.chdir(cwd)
+
+
+def seed(rows, user_rows=None, deadline_share=0.0):
+    # user_rows of the rows belong to USER_ID, the rest are spread over other users.
+    user_rows = rows if user_rows is None else user_rows
+    rng = random.Random(rows)
+    now = datetime.now(pytz.utc)
+    data = []
+    for i in range(rows):
+        is_deadline = rng.random() < deadline_share
+        data.append(
+            (
+                USER_ID if i < user_rows else rng.randint(2, 1_000),
+                f"habit {i} {rng.random():.6f}",
+                rng.random() < 0.3,
+                now,
+                is_deadline,
+                now + timedelta(days=rng.randint(1, 60)) if is_deadline else None,
+            )
+        )
+    conn = sqlite3.connect("habits.db")
+    conn.executemany(
+        "INSERT INTO habits (user_id, habit, is_done, created_at, is_deadline, deadline_date) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        data,
+    )
+    conn.commit()
+    ids = [row[0] for row in conn.execute("SELECT id FROM habits WHERE user_id = ?", (USER_ID,))]
+    conn.close()
+    return ids
+
+
+def measure(func, number, repeat):
+    # A case that raises is recorded as an error instead of aborting the whole run.
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            func(number)
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+        timings.append((time.perf_counter() - start) / number)
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def measure_async(loop, coro_factory, number, repeat):
+    async def batch(n):
+        for _ in range(n):
+            await coro_factory()
+
+    return measure(lambda n: loop.run_until_complete(batch(n)), number, repeat)
+
+
+def bench_db(results, sizes, repeat):
+    for size in sizes:
+        with fresh_db():
+            ids = seed(size, user_rows=min(size, 50))
+            rng = random.Random(size)
+            results[f"db.get_user_habits[{size}]"] = measure(
+                lambda n: [main.get_user_habits(USER_ID) for _ in range(n)], 200, repeat
+            )
+            results[f"db.get_habit[{size}]"] = measure(
+                lambda n: [main.get_habit(rng.choice(ids)) for _ in range(n)], 500, repeat
+            )
+            results[f"db.update_habit_status[{size}]"] = measure(
+                lambda n: [main.update_habit_status(rng.choice(ids), rng.random() < 0.5) for _ in range(n)],
+                200,
+                repeat,
+            )
+            results[f"db.add_habit_to_db[{size}]"] = measure(
+                lambda n: [main.add_habit_to_db(USER_ID, "bench") for _ in range(n)], 200, repeat
+            )
+
+
+def bench_reminders(results, loop, repeat):
+    with fresh_db():
+        habit_id = seed(1)[0]
+        main.update_habit_status(habit_id, False)
+        bot = StubBot()
+        deadline = datetime.now(pytz.utc) + timedelta(days=3)
+        reminder_context = SimpleNamespace(
+            bot=bot,
+            job=StubJob({"habit_id": habit_id, "habit_text": "bench"}),
+        )
+        deadline_context = SimpleNamespace(
+            bot=bot,
+            job=StubJob({"habit_id": habit_id, "deadline_name": "bench", "deadline_date": deadline}),
+        )
+        results["jobs.send_reminder"] = measure_async(
+            loop, lambda: main.send_reminder(reminder_context), 500, repeat
+        )
+        results["jobs.send_deadline_reminder"] = measure_async(
+            loop, lambda: main.send_deadline_reminder(deadline_context), 500, repeat
+        )
+
+
+def bench_my_habits(results, loop, sizes, repeat):
+    for size in sizes:
+        with fresh_db():
+            seed(size, deadline_share=0.2)
+            update = SimpleNamespace(message=StubMessage("Мои привычки"))
+            context = SimpleNamespace(user_data={})
+            number = max(5, 20_000 // size)
+            results[f"render.my_habits[{size}]"] = measure_async(
+                loop, lambda: main.my_habits(update, context), number, repeat
+            )
+
+
+def bench_dispatch(results, loop, repeat):
+    with fresh_db():
+        seed(20)
+        context = SimpleNamespace(user_data={})
+        updates = [SimpleNamespace(message=StubMessage(text)) for text in DISPATCH_TEXTS]
+        cycle = itertools.cycle(updates)
+        results["dispatch.handle_text"] = measure_async(
+            loop, lambda: main.handle_text(next(cycle), context), 1_000, repeat
+        )
+
+
+def run(args):
+    logging_level = main.logger.level
+    main.logger.setLevel("ERROR")
+    loop = asyncio.new_event_loop()
+    results = {}
+    table_sizes = QUICK_TABLE_SIZES if args.quick else TABLE_SIZES
+    render_sizes = QUICK_RENDER_SIZES if args.quick else RENDER_SIZES
+    try:
+        bench_db(results, table_sizes, args.repeat)
+        bench_reminders(results, loop, args.repeat)
+        bench_my_habits(results, loop, render_sizes, args.repeat)
+        bench_dispatch(results, loop, args.repeat)
+    finally:
+        loop.close()
+        main.logger.setLevel(logging_level)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(pytz.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sqlite": sqlite3.sqlite_version,
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    errors = 0
+    for name, stats in results.items():
+        if "error" in stats:
+            errors += 1
+            print(f"{name:45} ERROR {stats['error']}")
+        else:
+            print(f"{name:45} {stats['median'] * 1e6:12.1f} us")
+    print(f"Saved {len(results)} results to {args.output}")
+    if errors:
+        print(f"{errors} case(s) failed")
+        return 1
+    return 0
+
+
+def compare(args):
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    with open(args.candidate, encoding="utf-8") as f:
+        candidate = json.load(f)["results"]
+
+    regressions = []
+    for name in sorted(baseline.keys() & candidate.keys()):
+        if "error" in candidate[name]:
+            print(f"{name:45} ERROR {candidate[name]['error']}")
+            regressions.append(name)
+            continue
+        if "error" in baseline[name]:
+            print(f"{name:45} fixed in {args.candidate}")
+            continue
+        before = baseline[name]["median"]
+        after = candidate[name]["median"]
+        ratio = after / before if before else float("inf")
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - args.threshold:
+            flag = "faster"
+        print(f"{name:45} {before * 1e6:12.1f} us {after * 1e6:12.1f} us {ratio:7.2f}x {flag}")
+
+    for name in sorted(baseline.keys() - candidate.keys()):
+        print(f"{name:45} missing in {args.candidate}")
+    for name in sorted(candidate.keys() - baseline.keys()):
+        print(f"{name:45} new in {args.candidate}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    print(f"No regressions above {args.threshold:.0%}")
+    return 0
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for main.py")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks and save results as JSON")
+    run_parser.add_argument("-o", "--output", default="bench_results.json")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--quick", action="store_true", help="only the smallest sizes")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative slowdown flagged as regression"
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import logging
 from telegram import Update, ReplyKeyboardMarkup, ReplyKeyboardRemove
 from telegram.ext import (
@@ -14,6 +16,7 @@ from datetime import datetime, timedelta
 import sqlite3
 import pytz
 import re
+import signal
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
 )
@@ -28,6 +31,17 @@ logger = logging.getLogger(__name__)
     DELETING_ITEM,
     SETTING_REMINDER_INTERVAL,
 ) = range(8)
+MAX_BATCH_SIZE = 500
+MAX_HABIT_ID = 2 ** 63 - 1
+SUMMARY_LIMIT = 3000
+MAX_KEYBOARD_IDS = 20
+SHUTDOWN_TIMEOUT = 10
+LAST_FIRED_FLUSH_INTERVAL = 60
+CATCH_UP_DELAY = 10
+
+stopping = asyncio.Event()
+pending_sends = set()
+last_fired = {}
 
 
 def init_db():
@@ -60,20 +74,32 @@ def init_db():
             FALSE,
             deadline_date
             TIMESTAMP
+            NULL,
+            last_fired_at
+            TIMESTAMP
+            NULL,
+            chat_id
+            INTEGER
             NULL
         )
         """
     )
+    cursor.execute("PRAGMA table_info(habits)")
+    columns = [column[1] for column in cursor.fetchall()]
+    for name, definition in (("last_fired_at", "TIMESTAMP NULL"), ("chat_id", "INTEGER NULL")):
+        if name not in columns:
+            cursor.execute(f"ALTER TABLE habits ADD COLUMN {name} {definition}")
     conn.commit()
     conn.close()
 
 
-def add_habit_to_db(user_id, habit_text, is_deadline=False, deadline_date=None):
+def add_habit_to_db(user_id, habit_text, is_deadline=False, deadline_date=None, chat_id=None):
     conn = sqlite3.connect("habits.db")
     cursor = conn.cursor()
     cursor.execute(
-        "INSERT INTO habits (user_id, habit, is_done, created_at, is_deadline, deadline_date) VALUES (?, ?, ?, ?, ?, ?)",
-        (user_id, habit_text, False, datetime.now(pytz.utc), is_deadline, deadline_date),
+        "INSERT INTO habits (user_id, habit, is_done, created_at, is_deadline, deadline_date, chat_id) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (user_id, habit_text, False, datetime.now(pytz.utc), is_deadline, deadline_date, chat_id),
     )
     habit_id = cursor.lastrowid
     conn.commit()
@@ -115,6 +141,51 @@ def update_habit_status(habit_id, is_done):
     conn.close()
 
 
+def get_habits(user_id, habit_ids):
+    conn = sqlite3.connect("habits.db")
+    cursor = conn.cursor()
+    placeholders = ", ".join("?" for _ in habit_ids)
+    cursor.execute(
+        "SELECT id, user_id, habit, is_done, reminder_interval, is_deadline, deadline_date FROM habits "
+        f"WHERE user_id = ? AND id IN ({placeholders}) ORDER BY id",
+        (user_id, *habit_ids)
+    )
+    habits = cursor.fetchall()
+    conn.close()
+    return habits
+
+
+def add_habits_to_db(user_id, habit_texts, chat_id=None):
+    conn = sqlite3.connect("habits.db")
+    cursor = conn.cursor()
+    created_at = datetime.now(pytz.utc)
+    cursor.executemany(
+        "INSERT INTO habits (user_id, habit, is_done, created_at, is_deadline, deadline_date, chat_id) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(user_id, habit_text, False, created_at, False, None, chat_id) for habit_text in habit_texts],
+    )
+    # The insert transaction is still open, so the newest rows of this user are ours.
+    cursor.execute(
+        "SELECT id FROM habits WHERE user_id = ? ORDER BY id DESC LIMIT ?",
+        (user_id, len(habit_texts))
+    )
+    habit_ids = [row[0] for row in reversed(cursor.fetchall())]
+    conn.commit()
+    conn.close()
+    return habit_ids
+
+
+def update_habits_status(habit_ids, is_done):
+    conn = sqlite3.connect("habits.db")
+    cursor = conn.cursor()
+    cursor.executemany(
+        "UPDATE habits SET is_done = ? WHERE id = ?",
+        [(is_done, habit_id) for habit_id in habit_ids]
+    )
+    conn.commit()
+    conn.close()
+
+
 def update_reminder_interval(habit_id, interval_seconds):
     conn = sqlite3.connect("habits.db")
     cursor = conn.cursor()
@@ -126,14 +197,136 @@ def update_reminder_interval(habit_id, interval_seconds):
     conn.close()
 
 
-def delete_habit(habit_id):
+def delete_habits(habit_ids):
+    conn = sqlite3.connect("habits.db")
+    cursor = conn.cursor()
+    cursor.executemany(
+        "DELETE FROM habits WHERE id = ?", [(habit_id,) for habit_id in habit_ids]
+    )
+    conn.commit()
+    conn.close()
+
+
+def get_active_habits():
+    conn = sqlite3.connect("habits.db")
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT id, user_id, chat_id, habit, reminder_interval, is_deadline, deadline_date, created_at, last_fired_at "
+        "FROM habits WHERE NOT is_done"
+    )
+    habits = cursor.fetchall()
+    conn.close()
+    return habits
+
+
+def save_last_fired(fired):
     conn = sqlite3.connect("habits.db")
     cursor = conn.cursor()
-    cursor.execute("DELETE FROM habits WHERE id = ?", (habit_id,))
+    cursor.executemany(
+        "UPDATE habits SET last_fired_at = ? WHERE id = ?",
+        [(fired_at, habit_id) for habit_id, fired_at in fired.items()]
+    )
     conn.commit()
     conn.close()
 
 
+def checkpoint_db():
+    conn = sqlite3.connect("habits.db")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+
+
+def flush_last_fired():
+    if not last_fired:
+        return
+    fired = dict(last_fired)
+    save_last_fired(fired)
+    for habit_id, fired_at in fired.items():
+        if last_fired.get(habit_id) == fired_at:
+            del last_fired[habit_id]
+
+
+def parse_timestamp(value):
+    if value is None:
+        return None
+    timestamp = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = pytz.utc.localize(timestamp)
+    return timestamp
+
+
+def parse_habit_ids(text):
+    # Accepts IDs and ranges separated by commas, spaces or newlines: "1, 4, 7-12".
+    habit_ids = []
+    text = re.sub(r"\s*-\s*", "-", text.strip())
+    for token in re.split(r"[,;\s]+", text):
+        if not token:
+            continue
+        match = re.fullmatch(r"(\d+)(?:-(\d+))?", token)
+        if not match:
+            raise ValueError(f"Invalid ID: {token}")
+        first = int(match.group(1))
+        last = int(match.group(2) or first)
+        if not 1 <= first <= last <= MAX_HABIT_ID or last - first >= MAX_BATCH_SIZE:
+            raise ValueError(f"Invalid ID: {token}")
+        habit_ids.extend(range(first, last + 1))
+        if len(habit_ids) > MAX_BATCH_SIZE:
+            raise ValueError("Too many IDs")
+    if not habit_ids:
+        raise ValueError("No IDs")
+    return list(dict.fromkeys(habit_ids))
+
+
+def remove_jobs(job_queue, names):
+    names = set(names)
+    for job in job_queue.jobs():
+        if job.name in names:
+            job.schedule_removal()
+
+
+def tracked_send(callback):
+    # Reminder jobs register themselves so that shutdown can wait for sends in progress.
+    @functools.wraps(callback)
+    async def wrapper(context: ContextTypes.DEFAULT_TYPE):
+        if stopping.is_set():
+            return
+        task = asyncio.current_task()
+        pending_sends.add(task)
+        try:
+            await callback(context)
+        finally:
+            pending_sends.discard(task)
+
+    return wrapper
+
+
+def summarize(items, separator, limit=SUMMARY_LIMIT):
+    # Telegram rejects messages over 4096 characters, so long lists end with "и ещё K".
+    text = ""
+    for count, item in enumerate(items):
+        part = f"{separator}{item}" if count else item
+        if len(text) + len(part) > limit:
+            rest = f"и ещё {len(items) - count}"
+            return f"{text}{separator}{rest}" if count else rest
+        text += part
+    return text
+
+
+def format_missing_ids(habit_ids, habits):
+    found_ids = {h[0] for h in habits}
+    missing = [str(habit_id) for habit_id in habit_ids if habit_id not in found_ids]
+    if not missing:
+        return ""
+    return f"\nНе найдены: {summarize(missing, ', ', limit=500)}"
+
+
+def id_keyboard(habits):
+    # Only the first IDs get buttons; longer lists are typed as "1, 4, 7-12".
+    keyboard = [[str(h[0])] for h in habits[:MAX_KEYBOARD_IDS]]
+    keyboard.append(["Отмена"])
+    return ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+
+
 def get_main_menu():
     return ReplyKeyboardMarkup(
         [
@@ -163,21 +356,35 @@ async def add_habit(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def habit_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    habit_text = update.message.text
+    habit_texts = [line.strip() for line in update.message.text.splitlines() if line.strip()]
     user_id = update.message.from_user.id
 
-    habit_id = add_habit_to_db(user_id, habit_text)
-    context.job_queue.run_repeating(
-        send_reminder,
-        interval=timedelta(seconds=3600),
-        first=10,
-        chat_id=update.message.chat_id,
-        data={"habit_id": habit_id, "habit_text": habit_text},
-        name=f"reminder_{habit_id}",
-    )
+    if not habit_texts or len(habit_texts) > MAX_BATCH_SIZE:
+        await update.message.reply_text(
+            f"Введите от 1 до {MAX_BATCH_SIZE} привычек, по одной на строку:",
+        )
+        return ADDING_HABIT
+
+    habit_ids = add_habits_to_db(user_id, habit_texts, chat_id=update.message.chat_id)
+    # Stagger the first reminders so a batch does not hit Telegram's per-chat rate limit at once.
+    for i, (habit_id, habit_text) in enumerate(zip(habit_ids, habit_texts)):
+        context.job_queue.run_repeating(
+            send_reminder,
+            interval=timedelta(seconds=3600),
+            first=10 + i,
+            chat_id=update.message.chat_id,
+            data={"habit_id": habit_id, "habit_text": habit_text},
+            name=f"reminder_{habit_id}",
+        )
 
+    if len(habit_texts) == 1:
+        added = f"Привычка '{habit_texts[0]}' добавлена! "
+    else:
+        added = f"Добавлено привычек: {len(habit_texts)}\n" + summarize(
+            [f"{habit_id}. {habit_text}" for habit_id, habit_text in zip(habit_ids, habit_texts)], "\n"
+        ) + "\n"
     await update.message.reply_text(
-        f"Привычка '{habit_text}' добавлена! По умолчанию напоминания приходят каждый час.\n"
+        f"{added}По умолчанию напоминания приходят каждый час.\n"
         "Вы можете изменить интервал напоминаний через меню 'Настроить напоминания'.",
         reply_markup=get_main_menu(),
     )
@@ -245,6 +452,7 @@ async def deadline_time_input(update: Update, context: ContextTypes.DEFAULT_TYPE
             context.user_data["deadline_name"],
             is_deadline=True,
             deadline_date=deadline_datetime,
+            chat_id=update.message.chat_id,
         )
 
         context.job_queue.run_daily(
@@ -276,6 +484,7 @@ async def deadline_time_input(update: Update, context: ContextTypes.DEFAULT_TYPE
         return SETTING_DEADLINE_TIME
 
 
+@tracked_send
 async def send_deadline_reminder(context: ContextTypes.DEFAULT_TYPE):
     job = context.job
     deadline_name = job.data["deadline_name"]
@@ -318,6 +527,7 @@ async def send_deadline_reminder(context: ContextTypes.DEFAULT_TYPE):
                 message,
                 reply_markup=get_main_menu(),
             )
+            last_fired[habit_id] = now
         except Exception as e:
             logger.error(f"Ошибка при отправке напоминания: {e}")
 
@@ -333,9 +543,10 @@ async def my_habits(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    message = "📋 Ваши привычки и дедлайны:\n\n"
+    entries = []
     for habit_id, habit_text, is_done, interval, is_deadline, deadline_date in habits:
         if is_deadline:
+            deadline_date = parse_timestamp(deadline_date)
             deadline_str = deadline_date.strftime("%d.%m.%Y") if deadline_date else "???"
             status = f"📅 Дедлайн: {deadline_str}"
         else:
@@ -344,10 +555,10 @@ async def my_habits(update: Update, context: ContextTypes.DEFAULT_TYPE):
             status = f"⏰ Напоминание: каждые {interval_hours}ч {interval_min}м"
 
         done_status = "✅ Выполнен" if is_done else "❌ Не выполнен"
-        message += f"{habit_id}. {habit_text}\n{status} - {done_status}\n\n"
+        entries.append(f"{habit_id}. {habit_text}\n{status} - {done_status}")
 
     await update.message.reply_text(
-        message,
+        "📋 Ваши привычки и дедлайны:\n\n" + summarize(entries, "\n\n"),
         reply_markup=get_main_menu(),
     )
 
@@ -364,12 +575,10 @@ async def mark_done(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    keyboard = [[str(habit_id)] for habit_id, _, _, _, _, _ in deadlines]
-    keyboard.append(["Отмена"])
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = id_keyboard(deadlines)
 
     await update.message.reply_text(
-        "Выберите ID дедлайна, который выполнили:",
+        "Выберите ID дедлайна, который выполнили, или введите несколько через запятую (например, 1, 4, 7-12):",
         reply_markup=reply_markup,
     )
     return MARKING_DONE
@@ -384,24 +593,7 @@ async def deadline_done_input(update: Update, context: ContextTypes.DEFAULT_TYPE
         return ConversationHandler.END
 
     try:
-        habit_id = int(update.message.text)
-        habit = get_habit(habit_id)
-
-        if not habit or not habit[5]:
-            await update.message.reply_text(
-                "Дедлайн не найден",
-                reply_markup=get_main_menu(),
-            )
-            return ConversationHandler.END
-
-        update_habit_status(habit_id, True)
-        for job in context.job_queue.get_jobs_by_name(f"deadline_{habit_id}"):
-            job.schedule_removal()
-
-        await update.message.reply_text(
-            f"Дедлайн '{habit[2]}' отмечен как выполненный! Напоминания отключены.",
-            reply_markup=get_main_menu(),
-        )
+        habit_ids = parse_habit_ids(update.message.text)
     except ValueError:
         await update.message.reply_text(
             "Пожалуйста, введите корректный ID",
@@ -409,6 +601,27 @@ async def deadline_done_input(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
         return MARKING_DONE
 
+    deadlines = [h for h in get_habits(update.message.from_user.id, habit_ids) if h[5]]
+    if not deadlines:
+        await update.message.reply_text(
+            "Дедлайн не найден",
+            reply_markup=get_main_menu(),
+        )
+        return ConversationHandler.END
+
+    update_habits_status([h[0] for h in deadlines], True)
+    remove_jobs(context.job_queue, [f"deadline_{h[0]}" for h in deadlines])
+
+    if len(deadlines) == 1:
+        message = f"Дедлайн '{deadlines[0][2]}' отмечен как выполненный! Напоминания отключены."
+    else:
+        names = summarize([f"'{h[2]}'" for h in deadlines], ", ")
+        message = f"Дедлайны {names} отмечены как выполненные! Напоминания отключены."
+    message += format_missing_ids(habit_ids, deadlines)
+    await update.message.reply_text(
+        message,
+        reply_markup=get_main_menu(),
+    )
     return ConversationHandler.END
 
 
@@ -423,12 +636,10 @@ async def delete_item(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    keyboard = [[str(habit_id)] for habit_id, _, _, _, _, _ in habits]
-    keyboard.append(["Отмена"])
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = id_keyboard(habits)
 
     await update.message.reply_text(
-        "Выберите ID привычки/дедлайна для удаления:",
+        "Выберите ID привычки/дедлайна для удаления или введите несколько через запятую (например, 1, 4, 7-12):",
         reply_markup=reply_markup,
     )
     return DELETING_ITEM
@@ -443,25 +654,7 @@ async def delete_item_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationHandler.END
 
     try:
-        habit_id = int(update.message.text)
-        habit = get_habit(habit_id)
-
-        if not habit:
-            await update.message.reply_text(
-                "Привычка/дедлайн не найден",
-                reply_markup=get_main_menu(),
-            )
-            return ConversationHandler.END
-        for job in context.job_queue.get_jobs_by_name(f"reminder_{habit_id}"):
-            job.schedule_removal()
-        for job in context.job_queue.get_jobs_by_name(f"deadline_{habit_id}"):
-            job.schedule_removal()
-        delete_habit(habit_id)
-
-        await update.message.reply_text(
-            f"Привычка/дедлайн '{habit[2]}' успешно удалён!",
-            reply_markup=get_main_menu(),
-        )
+        habit_ids = parse_habit_ids(update.message.text)
     except ValueError:
         await update.message.reply_text(
             "Пожалуйста, введите корректный ID",
@@ -469,6 +662,31 @@ async def delete_item_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return DELETING_ITEM
 
+    habits = get_habits(update.message.from_user.id, habit_ids)
+    if not habits:
+        await update.message.reply_text(
+            "Привычка/дедлайн не найден",
+            reply_markup=get_main_menu(),
+        )
+        return ConversationHandler.END
+
+    found_ids = [h[0] for h in habits]
+    remove_jobs(
+        context.job_queue,
+        [f"{prefix}_{habit_id}" for habit_id in found_ids for prefix in ("reminder", "deadline")],
+    )
+    delete_habits(found_ids)
+
+    if len(habits) == 1:
+        message = f"Привычка/дедлайн '{habits[0][2]}' успешно удалён!"
+    else:
+        names = summarize([f"'{h[2]}'" for h in habits], ", ")
+        message = f"Удалено привычек/дедлайнов: {len(habits)} ({names})"
+    message += format_missing_ids(habit_ids, habits)
+    await update.message.reply_text(
+        message,
+        reply_markup=get_main_menu(),
+    )
     return ConversationHandler.END
 
 
@@ -484,9 +702,7 @@ async def set_reminder(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    keyboard = [[str(habit_id)] for habit_id, _, _, _, _, _ in regular_habits]
-    keyboard.append(["Отмена"])
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = id_keyboard(regular_habits)
 
     await update.message.reply_text(
         "Выберите ID привычки для настройки напоминаний:",
@@ -578,6 +794,7 @@ async def set_reminder_interval_input(update: Update, context: ContextTypes.DEFA
     return ConversationHandler.END
 
 
+@tracked_send
 async def send_reminder(context: ContextTypes.DEFAULT_TYPE):
     job = context.job
     habit_text = job.data["habit_text"]
@@ -590,11 +807,129 @@ async def send_reminder(context: ContextTypes.DEFAULT_TYPE):
     conn.close()
 
     if not is_done:
-        await context.bot.send_message(
-            job.chat_id,
-            f"🔔 Напоминание: не забудьте выполнить привычку '{habit_text}'!",
-            reply_markup=get_main_menu(),
-        )
+        try:
+            await context.bot.send_message(
+                job.chat_id,
+                f"🔔 Напоминание: не забудьте выполнить привычку '{habit_text}'!",
+                reply_markup=get_main_menu(),
+            )
+            last_fired[habit_id] = datetime.now(pytz.utc)
+        except Exception as e:
+            logger.error(f"Ошибка при отправке напоминания: {e}")
+
+
+async def flush_last_fired_job(context: ContextTypes.DEFAULT_TYPE):
+    flush_last_fired()
+
+
+def restore_jobs(job_queue):
+    now = datetime.now(pytz.utc)
+    restored = caught_up = 0
+    for habit_id, user_id, chat_id, habit_text, interval, is_deadline, deadline_date, created_at, last_fired_at in (
+        get_active_habits()
+    ):
+        if chat_id is None:
+            # Rows created before the chat_id column; the bot was only used in private chats then.
+            chat_id = user_id
+        last_run = parse_timestamp(last_fired_at) or parse_timestamp(created_at)
+        if is_deadline:
+            deadline_date = parse_timestamp(deadline_date)
+            reminder_time = deadline_date.time()
+            data = {"habit_id": habit_id, "deadline_name": habit_text, "deadline_date": deadline_date}
+            previous_fire = pytz.utc.localize(datetime.combine(now.date(), reminder_time))
+            if previous_fire > now:
+                previous_fire -= timedelta(days=1)
+            catch_up_delay = CATCH_UP_DELAY + caught_up
+            # Skip the catch-up if the daily job fires soon after it anyway.
+            next_fire_delay = (previous_fire + timedelta(days=1) - now).total_seconds()
+            if last_run < previous_fire and next_fire_delay > catch_up_delay + 60:
+                job_queue.run_once(
+                    send_deadline_reminder,
+                    when=catch_up_delay,
+                    chat_id=chat_id,
+                    data=data,
+                    name=f"deadline_{habit_id}",
+                )
+                caught_up += 1
+            job_queue.run_daily(
+                send_deadline_reminder,
+                time=reminder_time,
+                days=tuple(range(7)),
+                chat_id=chat_id,
+                data=data,
+                name=f"deadline_{habit_id}",
+            )
+        else:
+            delay = (last_run + timedelta(seconds=interval) - now).total_seconds()
+            if delay <= 0:
+                # Missed reminders are sent once, one per second, so a long downtime is not a burst.
+                delay = CATCH_UP_DELAY + caught_up
+                caught_up += 1
+            job_queue.run_repeating(
+                send_reminder,
+                interval=timedelta(seconds=interval),
+                first=max(delay, CATCH_UP_DELAY),
+                chat_id=chat_id,
+                data={"habit_id": habit_id, "habit_text": habit_text},
+                name=f"reminder_{habit_id}",
+            )
+        restored += 1
+    logger.info(f"Восстановлено напоминаний: {restored}, пропущенных к отправке: {caught_up}")
+
+
+def schedule_jobs(job_queue):
+    restore_jobs(job_queue)
+    job_queue.run_repeating(
+        flush_last_fired_job,
+        interval=LAST_FIRED_FLUSH_INTERVAL,
+        first=LAST_FIRED_FLUSH_INTERVAL,
+        name="flush_last_fired",
+    )
+
+
+async def drain_sends(job_queue):
+    # Must run before Application.stop(): JobQueue.stop(wait=True) waits for running jobs without a timeout.
+    stopping.set()
+    job_queue.scheduler.pause()
+    if not pending_sends:
+        return
+    _, unfinished = await asyncio.wait(set(pending_sends), timeout=SHUTDOWN_TIMEOUT)
+    if unfinished:
+        logger.warning(f"Не дождались отправки {len(unfinished)} напоминаний, отменяем")
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+
+
+async def wait_for_stop_signal():
+    stop_signal = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_signal.set)
+        except NotImplementedError:
+            # Windows: Ctrl+C cancels the main task instead.
+            pass
+    try:
+        await stop_signal.wait()
+    except asyncio.CancelledError:
+        pass
+
+
+async def run_bot(application: Application):
+    async with application:
+        schedule_jobs(application.job_queue)
+        await application.updater.start_polling()
+        await application.start()
+
+        await wait_for_stop_signal()
+        logger.info("Остановка: ждём отправки напоминаний")
+
+        await application.updater.stop()
+        await drain_sends(application.job_queue)
+        await application.stop()
+        flush_last_fired()
+        checkpoint_db()
 
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -607,6 +942,8 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "• Отметить дедлайн - отметить дедлайн как выполненный\n"
         "• Удалить - удалить привычку или дедлайн\n"
         "• Настроить напоминания - изменить интервал напоминаний для привычки\n\n"
+        "📝 Можно добавить несколько привычек сразу - по одной на строку\n"
+        "🔢 Отметить или удалить можно несколько ID сразу: 1, 4, 7-12\n"
         "📅 Формат даты для дедлайнов: ДД.ММ.ГГГГ (например, 31.12.2023)\n"
         "⏱ Формат интервала напоминаний: дни:часы:минуты:секунды (например, 0:1:30:0)",
         reply_markup=get_main_menu(),
@@ -715,7 +1052,7 @@ def main():
     application.add_handler(conv_handler)
     application.add_handler(CommandHandler("help", help_command))
 
-    application.run_polling()
+    asyncio.run(run_bot(application))
 
 
 if __name__ == "__main__":